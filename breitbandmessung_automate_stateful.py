@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 import argparse
+import functools
 import json
 import os
 import random
 import re
 import time
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field as dc_field
+from operator import itemgetter
 from datetime import datetime, timedelta, date, time as dtime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from pywinauto import Desktop
+from pywinauto.findwindows import ElementAmbiguousError
 from pywinauto.timings import wait_until_passes, TimeoutError as PywinautoTimeoutError
 
 import sys
@@ -25,10 +29,12 @@ APP_DIR = app_dir()
 LOGFILE = APP_DIR / (Path(sys.argv[0]).stem + ".log" if sys.argv and sys.argv[0] else "breitbandmessung.log")
 
 def _log(msg: str):
-    LOGFILE.write_text(LOGFILE.read_text(encoding="utf-8") + msg + "\n" if LOGFILE.exists() else msg + "\n", encoding="utf-8")
+    # Append-only: never re-read the (potentially large) log just to add one line.
+    with LOGFILE.open("a", encoding="utf-8") as f:
+        f.write(msg + "\n")
 
 
-WINDOW_TITLE_RE = r".*Breitbandmessung.*"
+WINDOW_TITLE_RE = re.compile(r".*Breitbandmessung.*")
 
 DISCLAIMER_LABELS = [
     "Direkte LAN-Verbindung geprüft?",
@@ -45,11 +51,12 @@ NAV_CAMPAIGN = "Messkampagne starten"
 TAB_MEASUREMENT = "Messung"
 BTN_NEW_CAMPAIGN = "Neue Messkampagne starten"
 
-BTN_DO_MEASUREMENT_RE = r".*Messung.*durchf.*"
-BTN_START_MEASUREMENT_RE = r".*Messung.*start.*"
-NAV_CAMPAIGN_RE = r".*Messkampagne.*start.*"
-TAB_MEASUREMENT_RE = r"^\s*Messung\s*$"
-BTN_NEW_CAMPAIGN_RE = r".*Neue.*Messkampagne.*start.*"
+# Compiled once: these are passed as `title_re` on every UI probe (pywinauto accepts compiled patterns).
+BTN_DO_MEASUREMENT_RE = re.compile(r".*Messung.*durchf.*")
+BTN_START_MEASUREMENT_RE = re.compile(r".*Messung.*start.*")
+NAV_CAMPAIGN_RE = re.compile(r".*Messkampagne.*start.*")
+TAB_MEASUREMENT_RE = re.compile(r"^\s*Messung\s*$")
+BTN_NEW_CAMPAIGN_RE = re.compile(r".*Neue.*Messkampagne.*start.*")
 
 DEFAULT_STATE_FILE = "bbm_state.json"
 
@@ -65,18 +72,57 @@ def iso_dt(dt: Optional[datetime]) -> Optional[str]:
     return dt.isoformat(timespec="seconds") if dt else None
 
 
+# The same few state timestamps (last_start/last_end) are parsed on every scheduler pass.
+@functools.lru_cache(maxsize=8)
 def parse_iso_dt(s: Optional[str]) -> Optional[datetime]:
     if not s:
         return None
     return datetime.fromisoformat(s)
 
 
+SLEEP_HEARTBEAT_SECONDS = 1800
+
+
 def sleep_until(target: datetime):
+    # Sleep in bounded chunks against the wall clock: waits span hours/days and the PC may
+    # suspend or adjust its clock meanwhile, so one long sleep could overshoot by hours.
+    since_heartbeat = 0.0
     while True:
         remaining = (target - now()).total_seconds()
         if remaining <= 0:
             return
-        time.sleep(min(remaining, 60))
+        if since_heartbeat >= SLEEP_HEARTBEAT_SECONDS:
+            # Make multi-hour waits visible in the log (and show the process is still alive).
+            _log(f"SLEEP heartbeat until={iso_dt(target)} remaining={int(remaining)}s")
+            since_heartbeat = 0.0
+        chunk = min(remaining, 60)
+        time.sleep(chunk)
+        since_heartbeat += chunk
+
+
+def announce_wait(target: datetime, message: str, log_msg: str):
+    """Tell the user and the log why we are waiting, then sleep until `target`."""
+    print(message)
+    _log(log_msg)
+    sleep_until(target)
+
+
+def ui_retry_delay(
+    prev_delay: Optional[float],
+    rng: random.Random,
+    *,
+    base_seconds: float = 30.0,
+    cap_seconds: float = 600.0,
+) -> float:
+    """
+    Decorrelated-jitter backoff for UI retries.
+
+    Pass None for the first failure of a streak. Follow-up delays are drawn from
+    [base, 3 * previous] (capped), so they grow quickly but don't settle into a fixed rhythm.
+    """
+    if prev_delay is None:
+        return base_seconds
+    return min(cap_seconds, rng.uniform(base_seconds, prev_delay * 3))
 
 
 def required_gap_after_completed(completed_in_day: int) -> timedelta:
@@ -106,16 +152,20 @@ def min_gap_after_completed(completed_in_day: int, *, min_gap_buffer_seconds: in
     return required_gap_after_completed(completed_in_day) + timedelta(seconds=min_gap_buffer_seconds)
 
 
+# Pure function of three small ints; the scheduler re-evaluates it on every decision.
+@functools.lru_cache(maxsize=256)
 def min_remaining_gap_total(
     *,
     next_completed_in_day: int,
     day_goal: int,
     min_gap_buffer_seconds: int,
 ) -> timedelta:
-    # Sum of minimum gaps AFTER completions next_completed_in_day .. (day_goal-1).
-    total = timedelta(0)
-    for completed in range(next_completed_in_day, day_goal):
-        total += min_gap_after_completed(completed, min_gap_buffer_seconds=min_gap_buffer_seconds)
+    # Sum of minimum gaps AFTER completions next_completed_in_day .. (day_goal-1), in closed form:
+    # every gap is the regular one except the long gap after completing #5.
+    n = max(0, day_goal - next_completed_in_day)
+    total = n * min_gap_after_completed(0, min_gap_buffer_seconds=min_gap_buffer_seconds)
+    if next_completed_in_day <= 5 < day_goal:
+        total += required_gap_after_completed(5) - required_gap_after_completed(0)
     return total
 
 
@@ -142,33 +192,48 @@ class CronSchedule:
     minutes: Tuple[int, ...]
     hours: Tuple[int, ...]
     raw: str
+    # Index of the first scheduled value >= v for every possible v (len(field) if none).
+    _minute_idx: Tuple[int, ...] = dc_field(init=False, repr=False, compare=False)
+    _hour_idx: Tuple[int, ...] = dc_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_minute_idx", tuple(bisect_left(self.minutes, m) for m in range(60)))
+        object.__setattr__(self, "_hour_idx", tuple(bisect_left(self.hours, h) for h in range(24)))
 
     def next_on_or_after(self, dt: datetime) -> datetime:
         base = dt.replace(second=0, microsecond=0)
         if dt > base:
             base += timedelta(minutes=1)
 
-        for day_offset in range(0, 370):
-            d = base.date() + timedelta(days=day_offset)
-            start_hour = base.hour if day_offset == 0 else 0
-            for h in self.hours:
-                if h < start_hour:
-                    continue
-                start_minute = base.minute if (day_offset == 0 and h == base.hour) else 0
-                m = next((m for m in self.minutes if m >= start_minute), None)
-                if m is None:
-                    continue
-                return datetime.combine(d, dtime(hour=h, minute=m))
+        # Day/month/weekday are always "*", so the next match is either later today or
+        # tomorrow at the first scheduled time; no day-by-day search is needed.
+        d = base.date()
+        hi = self._hour_idx[base.hour]
+        if hi < len(self.hours) and self.hours[hi] == base.hour:
+            mi = self._minute_idx[base.minute]
+            if mi < len(self.minutes):
+                return datetime.combine(d, dtime(hour=base.hour, minute=self.minutes[mi]))
+            hi += 1
+        if hi < len(self.hours):
+            return datetime.combine(d, dtime(hour=self.hours[hi], minute=self.minutes[0]))
+        return datetime.combine(d + timedelta(days=1), dtime(hour=self.hours[0], minute=self.minutes[0]))
 
-            base = datetime.combine(d + timedelta(days=1), dtime(0, 0))
 
-        raise RuntimeError("cron schedule search exceeded bounds")
+def schedule_has_time_in_window(schedule: CronSchedule, start: datetime, end: datetime) -> bool:
+    """Whether any scheduled time falls in [start, end)."""
+    return schedule.next_on_or_after(start) < end
 
 
 def _parse_cron_field(field: str, *, min_value: int, max_value: int) -> Tuple[int, ...]:
     field = (field or "").strip()
     if field == "*":
         return tuple(range(min_value, max_value + 1))
+    if field.startswith("*/") and "," not in field:
+        # Plain step: already sorted and in range, no need for the set/sort/filter path.
+        step = int(field[2:])
+        if step <= 0:
+            raise ValueError(f"invalid step: {field!r}")
+        return tuple(range(min_value, max_value + 1, step))
 
     values = set()
     for part in field.split(","):
@@ -222,11 +287,14 @@ def parse_cron_schedule(expr: str) -> CronSchedule:
     return CronSchedule(minutes=minutes, hours=hours, raw=expr)
 
 
+_HHMM_RE = re.compile(r"^\d{1,2}:\d{2}$")
+
+
 def parse_next_start(s: str) -> datetime:
     s = (s or "").strip()
     if not s:
         raise argparse.ArgumentTypeError("Empty datetime")
-    if re.match(r"^\\d{1,2}:\\d{2}$", s):
+    if _HHMM_RE.match(s):
         t = parse_hhmm(s)
         dt = day_dt(date.today(), t)
         if dt <= now():
@@ -293,7 +361,9 @@ def choose_next_start_time(
 # State
 # -----------------------------
 def load_state(path: str) -> dict:
-    if not os.path.exists(path):
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
         return {
             "day_goal": 10,
             "campaign_goal": 30,
@@ -304,15 +374,23 @@ def load_state(path: str) -> dict:
             "last_end": None,
             "measurement_days": [],  # list of YYYY-MM-DD where we did at least 1 measurement
         }
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(raw)
+
+
+# Last serialized state written per path, so saves without changes don't touch the disk.
+_LAST_SAVED_STATE = {}
 
 
 def save_state(path: str, state: dict):
+    # Serialize in one go so the temp file gets a single write instead of many small ones.
+    data = json.dumps(state, indent=2, ensure_ascii=False)
+    if _LAST_SAVED_STATE.get(path) == data and os.path.exists(path):
+        return
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+        f.write(data)
     os.replace(tmp, path)
+    _LAST_SAVED_STATE[path] = data
 
 
 def ensure_day_rollover(state: dict):
@@ -342,7 +420,7 @@ def ensure_day_rollover(state: dict):
         if not s:
             continue
         try:
-            last_activity = datetime.fromisoformat(s)
+            last_activity = parse_iso_dt(s)
             break
         except Exception:
             continue
@@ -419,16 +497,21 @@ def ui_progress_sync_enabled(args: argparse.Namespace) -> bool:
     return True
 
 
+def last_measurement_day(state: dict) -> Optional[date]:
+    """Most recent entry of `measurement_days`, or None if nothing was measured yet."""
+    days = state.get("measurement_days")
+    return date.fromisoformat(days[-1]) if days else None
+
+
 def calendar_gap_ok(state: dict) -> bool:
     """
     BNetzA rule (as you described): between measurement days >= 1 calendar day.
     That means: if last measurement day was yesterday, today is NOT allowed for a "new day start".
     Allowed patterns: Mon -> Wed -> Fri (diff >= 2 days)
     """
-    days = state.get("measurement_days", [])
-    if not days:
+    last = last_measurement_day(state)
+    if last is None:
         return True
-    last = date.fromisoformat(days[-1])
     today = date.today()
     delta = (today - last).days
     return delta >= 2  # at least one calendar day *between* => need diff 2+
@@ -456,6 +539,7 @@ _CALENDAR_GAP_TIME_RE = re.compile(
     r"\bin\s+(?P<hours>\d{1,3})\s*:\s*(?P<minutes>\d{2})\s*(?:stunden|std\.?|h|hours?)\b",
     re.IGNORECASE,
 )
+_CALENDAR_GAP_KEYWORDS = ("mindestabstand", "kalendertag", "messtagen")
 
 
 def detect_calendar_gap_wait(win) -> Optional[timedelta]:
@@ -464,28 +548,37 @@ def detect_calendar_gap_wait(win) -> Optional[timedelta]:
 
     Example: "Sie können die Messung in 27:36 Stunden durchführen, da zwischen den Messtagen ... Kalendertag ..."
     """
+    # This runs on every readiness poll, so check node by node and stop as soon as both the
+    # wait time and one of the keywords were seen instead of joining/normalizing the whole screen.
+    texts = []
+    m = None
+    has_keyword = False
     try:
-        texts = []
         for t in win.descendants(control_type="Text"):
             try:
                 s = (t.window_text() or "").strip()
             except Exception:
                 continue
-            if s:
-                texts.append(s)
-        if not texts:
-            return None
+            if not s:
+                continue
+            texts.append(s)
+            if m is None:
+                m = _CALENDAR_GAP_TIME_RE.search(s)
+            if not has_keyword:
+                norm = _norm_text(s)
+                has_keyword = any(k in norm for k in _CALENDAR_GAP_KEYWORDS)
+            if m is not None and has_keyword:
+                break
     except Exception:
         return None
 
-    joined = "\n".join(texts)
-    norm = _norm_text(joined)
-    if not any(k in norm for k in ("mindestabstand", "kalendertag", "messtagen")):
-        return None
-
-    m = _CALENDAR_GAP_TIME_RE.search(joined)
-    if not m:
+    if not has_keyword:
         return None
+    if m is None:
+        # The wait time may be split across adjacent Text nodes.
+        m = _CALENDAR_GAP_TIME_RE.search("\n".join(texts))
+        if not m:
+            return None
     hours = int(m.group("hours"))
     minutes = int(m.group("minutes"))
     return timedelta(hours=hours, minutes=minutes)
@@ -511,37 +604,24 @@ def detect_campaign_complete_screen(win) -> bool:
         except Exception:
             pass
 
-    # Fallback: scan visible text.
+    # Fallback: scan visible text (joined once, so the phrase checks are plain substring tests).
     try:
-        texts = []
-        for ct in ("Text", "Document"):
-            for t in win.descendants(control_type=ct):
-                try:
-                    s = (t.window_text() or "").strip()
-                except Exception:
-                    continue
-                if s:
-                    texts.append(s)
+        texts = _window_texts(win.descendants(control_type="Text"))
+        texts += _window_texts(win.descendants(control_type="Document"))
         if not texts:
             # Last resort: scan everything (some Chromium builds don't expose Text/Document nodes).
-            for t in win.descendants():
-                try:
-                    s = (t.window_text() or "").strip()
-                except Exception:
-                    continue
-                if s:
-                    texts.append(s)
+            texts = _window_texts(win.descendants())
         if not texts:
             return False
     except Exception:
         return False
 
-    joined = "\n".join(texts)
-    norm = _norm_text(joined)
+    norm = _norm_text("\n".join(texts))
     if _norm_text(BTN_NEW_CAMPAIGN) in norm:
         return True
     return ("messkampagne" in norm) and ("abgeschlossen" in norm)
 
+
 def _find_chrome_content_handle(parent_hwnd: int) -> Optional[int]:
     """
     The Breitbandmessung app UI is rendered inside a Chromium child window.
@@ -561,17 +641,30 @@ def _find_chrome_content_handle(parent_hwnd: int) -> Optional[int]:
     return None
 
 
+# The window connect_main_window() last connected to: the UIA root it returned, the top-level
+# window it focused, and when that root was last handed out (time.monotonic()).
+_connected = {"root": None, "top": None, "last_used": None}
+MAIN_WINDOW_MAX_IDLE_SECONDS = 15 * 60
+
+
 def connect_main_window():
     desk = Desktop(backend="uia")
     wins = desk.windows(title_re=WINDOW_TITLE_RE, top_level_only=True)
     if not wins:
-        raise RuntimeError(f"No window found matching title {WINDOW_TITLE_RE!r}")
+        raise RuntimeError(f"No window found matching title {WINDOW_TITLE_RE.pattern!r}")
 
     visible = [w for w in wins if w.is_visible()]
     candidates = visible or wins
 
-    def _score(w) -> int:
-        spec = desk.window(handle=getattr(w, "handle", None))
+    content_hwnds = {}
+
+    def _content_hwnd(w) -> Optional[int]:
+        hwnd = int(getattr(w, "handle", 0))
+        if hwnd not in content_hwnds:
+            content_hwnds[hwnd] = _find_chrome_content_handle(hwnd)
+        return content_hwnds[hwnd]
+
+    def _cheap_score(w) -> int:
         score = 0
         try:
             title = (w.window_text() or "").strip()
@@ -591,27 +684,32 @@ def connect_main_window():
             pass
 
         # Prefer windows where we can also access the Chromium content handle.
-        content_hwnd = _find_chrome_content_handle(int(getattr(w, "handle", 0)))
-        if content_hwnd:
+        if _content_hwnd(w):
             score += 20
-            content_spec = desk.window(handle=content_hwnd)
-        else:
-            content_spec = spec
+        return score
 
-        # Check for typical content elements inside the Chromium host.
+    def _content_score(w) -> int:
+        content_hwnd = _content_hwnd(w)
+        content_spec = desk.window(handle=content_hwnd or getattr(w, "handle", None))
+        score = 0
+        # Check for typical content elements inside the Chromium host. UIA lookups resolve
+        # synchronously, so a short timeout only cuts the wait on a miss.
         try:
-            if content_spec.child_window(title_re=NAV_CAMPAIGN_RE).exists(timeout=0.5):
+            if content_spec.child_window(title_re=NAV_CAMPAIGN_RE).exists(timeout=0.1):
                 score += 10
         except Exception:
             pass
         try:
-            if content_spec.child_window(title_re=BTN_DO_MEASUREMENT_RE).exists(timeout=0.5):
+            if content_spec.child_window(title_re=BTN_DO_MEASUREMENT_RE).exists(timeout=0.1):
                 score += 10
         except Exception:
             pass
         return score
 
-    if len(candidates) > 1:
+    if len(candidates) == 1:
+        # Nothing to choose from: skip the (slow) UIA content probes entirely.
+        win = candidates[0]
+    else:
         _log("Multiple windows matched WINDOW_TITLE_RE; selecting best candidate.")
         for w in candidates:
             try:
@@ -619,13 +717,27 @@ def connect_main_window():
             except Exception:
                 _log("  hwnd=? title=? visible=? enabled=?")
 
-    win = max(candidates, key=_score)
-    wait_until_passes(15, 0.5, lambda: win.is_visible() or True)
+        # The content probes add at most 20 points, so only candidates within 20 points of the
+        # best title/class score can still win; probe just those.
+        scored = [(_cheap_score(w), w) for w in candidates]
+        top = max(sc for sc, _ in scored)
+        contenders = [(sc, w) for sc, w in scored if sc + 20 >= top]
+        # Exact app title + Chromium host class + content hwnd (90) is as good as it gets;
+        # if exactly one window has that, the content probes can't change the outcome.
+        best = [w for sc, w in scored if sc >= 90]
+        if len(best) == 1:
+            win = best[0]
+        elif len(contenders) == 1:
+            win = contenders[0][1]
+        else:
+            win = max(contenders, key=lambda sw: sw[0] + _content_score(sw[1]))[1]
+
     win.set_focus()
 
     top_hwnd = int(getattr(win, "handle", 0))
-    content_hwnd = _find_chrome_content_handle(top_hwnd)
+    content_hwnd = _content_hwnd(win)
     root = desk.window(handle=content_hwnd) if content_hwnd else desk.window(handle=top_hwnd)
+    _connected.update(root=root, top=win, last_used=time.monotonic())
 
     try:
         print(
@@ -638,6 +750,33 @@ def connect_main_window():
     return root
 
 
+def reconnect_main_window(win=None, *, max_idle_seconds: float = MAIN_WINDOW_MAX_IDLE_SECONDS):
+    """
+    Reuse `win` (the root last returned by connect_main_window) if its handle still resolves,
+    otherwise connect afresh.
+
+    A full connect enumerates all top-level windows and probes the Chromium host; the cached
+    root only needs a single handle lookup. Pass None to force a full connect (e.g. after a
+    UI failure). After more than `max_idle_seconds` without use (a long sleep, during which
+    the app may have been restarted or re-rendered) the cached root is not trusted either.
+    """
+    if win is not None and win is _connected["root"]:
+        idle = time.monotonic() - _connected["last_used"]
+        if idle > max_idle_seconds:
+            _log(f"UI cached_window_idle idle={int(idle)}s reconnecting")
+        else:
+            try:
+                if win.exists(timeout=0):
+                    # Focus the top-level window, like connect_main_window does, not the content child.
+                    _connected["top"].set_focus()
+                    _connected["last_used"] = time.monotonic()
+                    return win
+            except Exception:
+                pass
+            _log("UI cached_window_stale reconnecting")
+    return connect_main_window()
+
+
 def dump_ui(win, tag: str) -> Optional[Path]:
     try:
         dump_path = APP_DIR / (
@@ -651,32 +790,86 @@ def dump_ui(win, tag: str) -> Optional[Path]:
         return None
 
 
+# Whether the typed (True) or untyped (False) lookup last found each title_re target; the
+# readiness loops ask for the same buttons many times, so the known-good variant goes first.
+_LAST_GOOD_TITLE_RE_LOOKUP = {}
+
+
+def _find_by_title_re(win, title_re, *, control_type="Button", timeout: float = 0.5):
+    """
+    Locate a control by title regex, preferring the typed (e.g. Button) match.
+
+    Returns the window specification, or None if neither lookup finds anything. Only the first
+    lookup waits (the variant that worked last time for this pattern, typed by default); the
+    other is probed without waiting, so an absent control costs one timed lookup per call.
+    """
+    key = (getattr(title_re, "pattern", title_re), control_type)
+    variants = [True, False]
+    if _LAST_GOOD_TITLE_RE_LOOKUP.get(key) is False:
+        variants.reverse()
+    waited = False
+    typed_absent = False
+    for typed in variants:
+        if typed:
+            spec = win.child_window(title_re=title_re, control_type=control_type)
+        else:
+            spec = win.child_window(title_re=title_re)
+        try:
+            found = spec.exists(timeout=0 if waited else timeout)
+        except ElementAmbiguousError:
+            # exists() lets this through. In Chromium trees the untyped pattern can match a
+            # Button and its same-named Text child; the other variant may still be unique.
+            if not typed:
+                _LAST_GOOD_TITLE_RE_LOOKUP.pop(key, None)
+            continue
+        waited = True
+        if found:
+            if typed:
+                _LAST_GOOD_TITLE_RE_LOOKUP[key] = True
+            elif typed_absent:
+                # Only prefer the untyped lookup once the typed one was seen to miss.
+                _LAST_GOOD_TITLE_RE_LOOKUP[key] = False
+            return spec
+        if typed:
+            typed_absent = True
+    return None
+
+
 def click_by_text(win, text=None, *, title_re=None, control_type=None, timeout=10):
     def _do():
-        candidates = []
+        criteria = []
         if text is not None:
-            if control_type:
-                candidates.append(win.child_window(title=text, control_type=control_type))
-            candidates.append(win.child_window(title=text))
+            criteria.append({"title": text})
         if title_re is not None:
-            if control_type:
-                candidates.append(win.child_window(title_re=title_re, control_type=control_type))
-            candidates.append(win.child_window(title_re=title_re))
+            criteria.append({"title_re": title_re})
 
         last_err = None
-        for el in candidates:
+        for crit in criteria:
+            untyped = win.child_window(**crit)
+            # The untyped lookup matches a superset of the typed one: if it finds nothing, neither
+            # can the typed variant, so a miss costs one timed probe instead of two.
             try:
-                if not el.exists(timeout=0.5):
+                if not untyped.exists(timeout=0.5):
                     continue
-                el.wait("visible", timeout=3)
-                el.click_input()
-                return True
             except Exception as e:
+                # e.g. several controls share the title; the typed lookup may still be unique.
                 last_err = e
-                continue
+
+            candidates = [untyped]
+            if control_type:
+                candidates.insert(0, win.child_window(**crit, control_type=control_type))
+            for el in candidates:
+                try:
+                    if not el.exists(timeout=0):
+                        continue
+                    el.wait("visible", timeout=3)
+                    el.click_input()
+                    return True
+                except Exception as e:
+                    last_err = e
+                    continue
 
         raise RuntimeError(f"Control not found/clickable (text={text!r}, title_re={title_re!r})") from last_err
-        return True
     return wait_until_passes(timeout, 0.5, _do)
 
 
@@ -688,15 +881,15 @@ def click_start_measurement(win, *, timeout: int = 30) -> bool:
     """
 
     def _get_btn():
-        btn = win.child_window(title_re=BTN_START_MEASUREMENT_RE, control_type="Button")
-        if not btn.exists(timeout=0.5):
-            btn = win.child_window(title_re=BTN_START_MEASUREMENT_RE)
+        btn = _find_by_title_re(win, BTN_START_MEASUREMENT_RE)
+        if btn is None:
+            raise RuntimeError("'Messung starten' not found")
         return btn
 
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
     last_err = None
     while True:
-        if time.time() >= deadline:
+        if time.monotonic() >= deadline:
             raise PywinautoTimeoutError("'Messung starten' was not clickable in time") from last_err
         try:
             btn = _get_btn()
@@ -717,22 +910,22 @@ def click_start_measurement(win, *, timeout: int = 30) -> bool:
             btn.click_input()
 
             # Ensure the click was accepted: the button should disappear or become disabled shortly after.
+            # `btn` is a lookup spec that re-resolves on every call, so no second search is needed.
             time.sleep(0.5)
             try:
-                btn2 = _get_btn()
                 try:
-                    if hasattr(btn2, "is_visible") and (not btn2.is_visible()):
+                    if hasattr(btn, "is_visible") and (not btn.is_visible()):
                         return True
                 except Exception:
                     return True
-                if not btn2.exists(timeout=0.2):
+                if not btn.exists(timeout=0.2):
                     return True
                 try:
-                    btn2.wait("visible", timeout=0.2)
+                    btn.wait("visible", timeout=0.2)
                 except Exception:
                     return True
                 try:
-                    if hasattr(btn2, "is_enabled") and (not btn2.is_enabled()):
+                    if hasattr(btn, "is_enabled") and (not btn.is_enabled()):
                         return True
                 except Exception:
                     return True
@@ -747,21 +940,22 @@ def rect_center(r):
     return ((r.left + r.right) / 2, (r.top + r.bottom) / 2)
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+# UI scans normalize the same control names (and the fixed disclaimer labels) over and over.
+@functools.lru_cache(maxsize=4096)
 def _norm_text(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = (
-        s.replace("ä", "ae")
-        .replace("ö", "oe")
-        .replace("ü", "ue")
-        .replace("ß", "ss")
-    )
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
+    s = (s or "").lower().translate(_UMLAUT_TABLE)
+    # Every run of non-alphanumerics (whitespace included) becomes a single space.
+    return _NON_ALNUM_RE.sub(" ", s).strip()
 
 
-def _token_set(s: str) -> set:
+@functools.lru_cache(maxsize=4096)
+def _token_set(s: str) -> frozenset:
     ns = _norm_text(s)
-    return {t for t in ns.split(" ") if t}
+    return frozenset(t for t in ns.split(" ") if t)
 
 
 def _try_get_checked_state(el) -> Optional[bool]:
@@ -797,12 +991,18 @@ def _try_click_named_toggle(dialog, label_text: str, *, min_score: float = 0.65)
         if not cand_tokens:
             continue
         overlap = len(target_tokens & cand_tokens)
+        if not overlap:
+            # No shared token scores 0 and can never beat the current best.
+            continue
         coverage = overlap / max(1, len(target_tokens))
         precision = overlap / max(1, len(cand_tokens))
         score = coverage * 0.8 + precision * 0.2
         if score > best_score:
             best_score = score
             best = c
+            if score >= 1.0:
+                # Exact token match; nothing later can score higher.
+                break
 
     if best is None or best_score < min_score:
         return False
@@ -823,25 +1023,26 @@ def _check_all_disclaimer_checkboxes(dialog) -> Tuple[int, int]:
     The 6 main disclaimer items are exposed as unlabeled UIA CheckBox controls.
     Click all unchecked ones in stable visual order.
     """
+    # Read visibility, position and toggle state in one pass so the click pass needs no further UIA reads.
     checkboxes = []
     for c in dialog.descendants(control_type="CheckBox"):
         try:
             if not c.is_visible():
                 continue
             r = c.rectangle()
-            checkboxes.append((r.top, r.left, c))
         except Exception:
             continue
-
-    checkboxes.sort(key=lambda x: (x[0], x[1]))
-    clicked = 0
-    for _, _, cb in checkboxes:
         try:
-            state = cb.get_toggle_state()
-            if state == 1:
-                continue
+            toggle = c.get_toggle_state()
         except Exception:
-            pass
+            toggle = None
+        checkboxes.append((r.top, r.left, toggle, c))
+
+    checkboxes.sort(key=itemgetter(0, 1))
+    clicked = 0
+    for _, _, toggle, cb in checkboxes:
+        if toggle == 1:
+            continue
         try:
             cb.click_input()
             clicked += 1
@@ -917,51 +1118,108 @@ def click_checkbox_near_label(dialog, label_text):
 
     if checkbox_candidates:
         # Prefer the nearest checkbox to the right of the label.
-        checkbox_candidates.sort(key=lambda x: (x[1], x[0]))
-        checkbox_candidates[0][2].click_input()
+        min(checkbox_candidates, key=itemgetter(1, 0))[2].click_input()
         return True
 
     if not other_candidates:
         raise RuntimeError(f"No checkbox candidate found near label: {label_text}")
 
-    other_candidates.sort(key=lambda x: x[0])
-    other_candidates[0][1].click_input()
+    min(other_candidates, key=itemgetter(0))[1].click_input()
     return True
 
 
+class _PollView:
+    """
+    Window proxy for one poll tick: repeated descendants() queries share a single UIA walk.
+
+    The completion-screen and calendar-gap detectors both scan the Text nodes; within one tick
+    the screen doesn't change, so there is no point walking the Chromium tree twice.
+    """
+
+    def __init__(self, win):
+        self._win = win
+        self._descendants = {}
+
+    def descendants(self, **kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in self._descendants:
+            self._descendants[key] = self._win.descendants(**kwargs)
+        return self._descendants[key]
+
+    def signature(self):
+        """Element count per query made this tick; a different count means the screen changed."""
+        return tuple((key, len(items)) for key, items in sorted(self._descendants.items()))
+
+    def __getattr__(self, name):
+        return getattr(self._win, name)
+
+
 def wait_for_campaign_ready(win, timeout=1200):
-    deadline = time.time() + timeout
+    deadline = time.monotonic() + timeout
     last_status = 0.0
+    # Poll quickly right after a click or a screen change, but back off while nothing
+    # happens (long cool-downs/measurements): every tick costs several UIA tree queries.
+    base_delay = 0.5
+    delay = base_delay
+    prev_signature = None
     while True:
         try:
-            btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE, control_type="Button")
-            if not btn.exists(timeout=0.5):
-                btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE)
-            btn.wait("visible", timeout=2)
-            return True
+            # Probe briefly: a miss is retried on the next tick anyway.
+            btn = _find_by_title_re(win, BTN_DO_MEASUREMENT_RE, timeout=0.1)
+            if btn is not None:
+                btn.wait("visible", timeout=2)
+                return True
         except Exception:
             pass
 
+        view = _PollView(win)
         # After the last measurement of a campaign, the app may show a completion screen
         # instead of returning to the normal campaign page.
-        if detect_campaign_complete_screen(win):
+        if detect_campaign_complete_screen(view):
             return True
 
-        gap_wait = detect_calendar_gap_wait(win)
+        gap_wait = detect_calendar_gap_wait(view)
         if gap_wait:
             raise CalendarGapBlocked(
                 gap_wait,
                 f"Calendar-gap block detected in UI; wait remaining: {gap_wait}.",
             )
 
-        now_s = time.time()
+        signature = view.signature()
+        if prev_signature is not None and signature != prev_signature:
+            delay = base_delay
+        prev_signature = signature
+
+        now_s = time.monotonic()
         if now_s >= deadline:
             raise PywinautoTimeoutError("timed out")
         if now_s - last_status >= 60:
             remaining = int(deadline - now_s)
             print(f"Still waiting for readiness... ({remaining}s left)", flush=True)
             last_status = now_s
-        time.sleep(2)
+        time.sleep(min(delay, deadline - now_s))
+        delay = min(15.0, delay * 1.5)
+
+
+# control_type that last worked per click target; the app version doesn't change during a run,
+# so trying it first usually avoids the misses (and their timeouts) of the other variants.
+_LAST_GOOD_CONTROL_TYPE = {}
+
+
+def _click_by_text_any_type(win, key: str, control_types, text=None, *, title_re=None, timeout=10) -> bool:
+    """click_by_text over several control types, starting with the one that worked last time for `key`."""
+    order = list(control_types)
+    if key in _LAST_GOOD_CONTROL_TYPE and _LAST_GOOD_CONTROL_TYPE[key] in order:
+        order.remove(_LAST_GOOD_CONTROL_TYPE[key])
+        order.insert(0, _LAST_GOOD_CONTROL_TYPE[key])
+    for ct in order:
+        try:
+            click_by_text(win, text, title_re=title_re, control_type=ct, timeout=timeout)
+        except Exception:
+            continue
+        _LAST_GOOD_CONTROL_TYPE[key] = ct
+        return True
+    return False
 
 
 def ensure_on_measurement_tab(win) -> bool:
@@ -970,26 +1228,21 @@ def ensure_on_measurement_tab(win) -> bool:
 
     Some app versions hide the "Messung durchführen" button while on the "Ergebnisse" tab.
     """
-    for ct in ("TabItem", "Button", "Text", None):
-        try:
-            click_by_text(win, TAB_MEASUREMENT, title_re=TAB_MEASUREMENT_RE, control_type=ct, timeout=3)
-            time.sleep(0.5)
-            return True
-        except Exception:
-            continue
+    control_types = ("TabItem", "Button", "Text", None)
+    if _click_by_text_any_type(
+        win, "tab_measurement", control_types, TAB_MEASUREMENT, title_re=TAB_MEASUREMENT_RE, timeout=3
+    ):
+        time.sleep(0.5)
+        return True
     return False
 
 
 def try_start_new_campaign(win) -> bool:
     # In Chromium-hosted UIA, this is commonly exposed as a Hyperlink.
-    for ct in ("Hyperlink", "Button", "Text", None):
-        try:
-            # Prefer the exact title to avoid accidentally clicking a huge Document element
-            # that happens to contain the text (common on completion screens).
-            click_by_text(win, BTN_NEW_CAMPAIGN, control_type=ct, timeout=10)
-            return True
-        except Exception:
-            continue
+    # Prefer the exact title to avoid accidentally clicking a huge Document element
+    # that happens to contain the text (common on completion screens).
+    if _click_by_text_any_type(win, "new_campaign", ("Hyperlink", "Button", "Text", None), BTN_NEW_CAMPAIGN):
+        return True
     # As a fallback, allow regex matching, but keep it restricted to likely clickable controls.
     for ct in ("Hyperlink", "Button"):
         try:
@@ -1011,8 +1264,8 @@ def start_new_campaign_and_wait(win, *, timeout: int = 60) -> bool:
     if not try_start_new_campaign(win):
         return False
 
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         # Wait for the completion screen to disappear.
         if detect_campaign_complete_screen(win):
             time.sleep(1)
@@ -1022,10 +1275,7 @@ def start_new_campaign_and_wait(win, *, timeout: int = 60) -> bool:
         ensure_on_campaign_page(win)
 
         try:
-            btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE, control_type="Button")
-            if not btn.exists(timeout=0.2):
-                btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE)
-            if btn.exists(timeout=0.2):
+            if _find_by_title_re(win, BTN_DO_MEASUREMENT_RE, timeout=0.2) is not None:
                 return True
         except Exception:
             pass
@@ -1039,6 +1289,17 @@ def start_new_campaign_and_wait(win, *, timeout: int = 60) -> bool:
 
 
 def ensure_on_campaign_page(win, *, allow_start_new_campaign: bool = False):
+    # Usually we're already there: a visible measurement button means the right page and tab,
+    # so skip the completion-screen check and the tab/navigation click attempts.
+    try:
+        # A miss just falls through to the navigation below, so don't wait long for it.
+        btn = _find_by_title_re(win, BTN_DO_MEASUREMENT_RE, timeout=0.1)
+        if btn is not None:
+            btn.wait("visible", timeout=1)
+            return
+    except Exception:
+        pass
+
     if allow_start_new_campaign and detect_campaign_complete_screen(win):
         if try_start_new_campaign(win):
             _log("UI new_campaign_started")
@@ -1048,11 +1309,10 @@ def ensure_on_campaign_page(win, *, allow_start_new_campaign: bool = False):
     ensure_on_measurement_tab(win)
 
     try:
-        btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE, control_type="Button")
-        if not btn.exists(timeout=0.5):
-            btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE)
-        btn.wait("visible", timeout=2)
-        return
+        btn = _find_by_title_re(win, BTN_DO_MEASUREMENT_RE)
+        if btn is not None:
+            btn.wait("visible", timeout=2)
+            return
     except Exception:
         pass
 
@@ -1067,18 +1327,13 @@ def ensure_on_campaign_page(win, *, allow_start_new_campaign: bool = False):
             pass
 
     # Try navigation / "start campaign" entry points.
-    for ct in ("Button", "Text", None):
-        try:
-            click_by_text(win, NAV_CAMPAIGN, title_re=NAV_CAMPAIGN_RE, control_type=ct, timeout=5)
-            break
-        except Exception:
-            continue
+    _click_by_text_any_type(win, "nav_campaign", ("Button", "Text", None), NAV_CAMPAIGN, title_re=NAV_CAMPAIGN_RE, timeout=5)
 
     time.sleep(1)
     try:
-        btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE, control_type="Button")
-        if not btn.exists(timeout=0.5):
-            btn = win.child_window(title_re=BTN_DO_MEASUREMENT_RE)
+        btn = _find_by_title_re(win, BTN_DO_MEASUREMENT_RE)
+        if btn is None:
+            raise RuntimeError("'Messung durchführen' not found")
         btn.wait("visible", timeout=2)
     except Exception as e:
         _log(f"UI campaign_page_nav_done but button not visible yet: {e!r}")
@@ -1109,9 +1364,9 @@ def run_single_measurement(win, *, allow_start_new_campaign: bool = False) -> Tu
         raise
 
     def _wait_start_btn():
-        btn = win.child_window(title_re=BTN_START_MEASUREMENT_RE, control_type="Button")
-        if not btn.exists(timeout=0.5):
-            btn = win.child_window(title_re=BTN_START_MEASUREMENT_RE)
+        btn = _find_by_title_re(win, BTN_START_MEASUREMENT_RE)
+        if btn is None:
+            raise RuntimeError("'Messung starten' not found")
         btn.wait("visible", timeout=2)
         return True
 
@@ -1139,46 +1394,53 @@ def run_single_measurement(win, *, allow_start_new_campaign: bool = False) -> Tu
 # -----------------------------
 # Optional: try read progress from UI
 # -----------------------------
+_PROGRESS_PAIR_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+
+
+def _window_texts(elements) -> List[str]:
+    """Stripped, non-empty window texts of `elements` (unreadable elements are skipped)."""
+    texts = []
+    for el in elements:
+        try:
+            s = (el.window_text() or "").strip()
+        except Exception:
+            continue
+        if s:
+            texts.append(s)
+    return texts
+
+
 def detect_progress_from_ui(win, day_goal: int, campaign_goal: int) -> Optional[Tuple[int, int]]:
     """
     Best-effort: scan UI elements for patterns like "6/10" and "6/30".
     Returns (day_done, campaign_done) if found.
     """
-    strict = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
-    loose = re.compile(r"(\d+)\s*/\s*(\d+)")
-    pairs = []
+    found = {"day": None, "campaign": None}
 
     def _collect(descendants):
-        for el in descendants:
-            try:
-                s = (el.window_text() or "").strip()
-            except Exception:
+        # Only the first pair of each element counts (a longer text may hold other fractions).
+        # Texts without a "/" (most of the screen) can't hold a pair and skip the regex.
+        for s in _window_texts(descendants):
+            if "/" not in s:
                 continue
-            if not s:
+            m = _PROGRESS_PAIR_RE.search(s)
+            if not m:
                 continue
-            m = strict.match(s)
-            if m:
-                pairs.append((int(m.group(1)), int(m.group(2))))
-                continue
-            m2 = loose.search(s)
-            if m2:
-                pairs.append((int(m2.group(1)), int(m2.group(2))))
+            a, b = int(m.group(1)), int(m.group(2))
+            if b == day_goal:
+                found["day"] = a if found["day"] is None else max(found["day"], a)
+            if b == campaign_goal:
+                found["campaign"] = a if found["campaign"] is None else max(found["campaign"], a)
 
     # Fast path: most UIs expose these as Text elements.
     _collect(win.descendants(control_type="Text"))
-    # Fallback: Chromium-hosted UIs sometimes expose text on other element types.
-    _collect(win.descendants())
-
-    day_done = None
-    campaign_done = None
-    for a, b in pairs:
-        if b == day_goal:
-            day_done = a if day_done is None else max(day_done, a)
-        if b == campaign_goal:
-            campaign_done = a if campaign_done is None else max(campaign_done, a)
-
-    if day_done is not None and campaign_done is not None:
-        return (day_done, campaign_done)
+    # Fallback: Chromium-hosted UIs sometimes expose text on other element types. The full walk
+    # re-reads every node, so only pay for it if the Text nodes didn't have both counters.
+    if found["day"] is None or found["campaign"] is None:
+        _collect(win.descendants())
+
+    if found["day"] is not None and found["campaign"] is not None:
+        return (found["day"], found["campaign"])
     return None
 
 
@@ -1303,16 +1565,7 @@ def main():
         start_dt = day_dt(d0, args.day_start)
         end_dt = day_dt(d0, args.day_end)
         latest_start_dt = latest_start_within_day(end_dt, day_end_buffer_seconds=args.day_end_buffer_seconds)
-        any_in_window = False
-        for h in schedule.hours:
-            for m in schedule.minutes:
-                t = datetime.combine(d0, dtime(hour=h, minute=m))
-                if start_dt <= t < latest_start_dt:
-                    any_in_window = True
-                    break
-            if any_in_window:
-                break
-        if not any_in_window:
+        if not schedule_has_time_in_window(schedule, start_dt, latest_start_dt):
             raise SystemExit(
                 "--schedule-cron has no times within the daily window (after applying --day-end-buffer-seconds); "
                 "adjust --schedule-cron/--day-start/--day-end/--day-end-buffer-seconds."
@@ -1389,9 +1642,13 @@ def main():
         run_until_campaign = args.run_until_campaign_done or args.run_forever
     next_start_override = args.next_start
 
+    # Day bounds only depend on the date (args are fixed for the run), but the loop asks for
+    # them on every pass; a few entries cover today, tomorrow and the calendar-gap day.
+    @functools.lru_cache(maxsize=8)
     def _day_start_end(d: date) -> Tuple[datetime, datetime]:
         return day_dt(d, args.day_start), day_dt(d, args.day_end)
 
+    @functools.lru_cache(maxsize=8)
     def _latest_start_for_day(d: date) -> datetime:
         _day_start_dt, _day_end_dt = _day_start_end(d)
         return latest_start_within_day(_day_end_dt, day_end_buffer_seconds=args.day_end_buffer_seconds)
@@ -1421,24 +1678,30 @@ def main():
         return day_start_dt + timedelta(seconds=jitter_seconds)
 
     ui_failures = 0
+    retry_delay = None
+    # Unseeded on purpose: UI failures happen at random, so drawing their backoff from `rng`
+    # would shift every later scheduling draw of a --random-seed run.
+    retry_rng = random.Random()
     while state["campaign_done"] < state["campaign_goal"]:
         ensure_day_rollover(state)
         today = date.fromisoformat(state["current_day"])
         day_start_dt, day_end_dt = _day_start_end(today)
         latest_start_dt = _latest_start_for_day(today)
+        last_measured_day = last_measurement_day(state)
 
         if state["day_done"] >= state["day_goal"]:
             if not run_until_campaign:
                 print("Daily limit reached. Stop for today.")
                 return
 
-            last_measured = date.fromisoformat(state["measurement_days"][-1]) if state.get("measurement_days") else today
-            next_day = _next_allowed_measurement_day(last_measured)
+            next_day = _next_allowed_measurement_day(last_measured_day or today)
             target = _first_start_for_day(next_day)
             print(f"Daily limit reached. Next measurement day earliest: {target}.")
-            _log(f"SCHED daily_limit next={iso_dt(target)}")
-            print(f"Waiting until next measurement day: {target} ...")
-            sleep_until(target)
+            announce_wait(
+                target,
+                f"Waiting until next measurement day: {target} ...",
+                f"SCHED daily_limit next={iso_dt(target)}",
+            )
             continue
 
         # Calendar-gap enforcement only when starting a new day (day_done == 0)
@@ -1447,7 +1710,7 @@ def main():
                 # If state says "new day start", but the UI still shows e.g. 9/10, we're actually resuming
                 # an incomplete measurement day (midnight rollover). Trust the UI to avoid false blocks.
                 try:
-                    win = connect_main_window()
+                    win = reconnect_main_window(win if ui_failures == 0 else None)
                     if ui_sync and sync_progress_from_ui(win, state) and int(state.get("day_done") or 0) > 0:
                         _log(
                             f"SCHED ui_progress_resume day_done={state.get('day_done')} "
@@ -1462,7 +1725,7 @@ def main():
                 except Exception:
                     pass
 
-                last = date.fromisoformat(state["measurement_days"][-1])
+                last = last_measured_day
                 next_day = _next_allowed_measurement_day(last)
                 target = _first_start_for_day(next_day)
                 print(
@@ -1478,14 +1741,27 @@ def main():
                 # if a measurement day carried across midnight. The UI-level check in run_single_measurement
                 # will still enforce the rule if the app blocks.
 
+        # One clock reading for the remaining decisions of this pass (taken after the UI sync
+        # above, which can take a while); every branch below either sleeps and re-loops or
+        # falls through to the measurement within moments.
+        tnow = now()
+        # Latest start for the next measurement that still leaves room for today's remaining gaps.
+        latest_next_start = (latest_start_dt - timedelta(seconds=1)) - min_remaining_gap_total(
+            next_completed_in_day=state["day_done"] + 1,
+            day_goal=state["day_goal"],
+            min_gap_buffer_seconds=args.min_gap_buffer_seconds,
+        )
+
         # If it's before the daily window, wait until the window opens.
         # (Also applies when resuming an incomplete measurement day across midnight.)
-        if now() < day_start_dt:
+        if tnow < day_start_dt:
             target = _first_start_for_day(today) if state["day_done"] == 0 else day_start_dt
-            if now() < target:
-                print(f"Waiting for daily window start: {target} ...")
-                _log(f"SCHED day_window_start sleep_until={iso_dt(target)}")
-                sleep_until(target)
+            if tnow < target:
+                announce_wait(
+                    target,
+                    f"Waiting for daily window start: {target} ...",
+                    f"SCHED day_window_start sleep_until={iso_dt(target)}",
+                )
             continue
 
         # Optional: align to a user-provided schedule / start override before attempting the next measurement.
@@ -1495,11 +1771,11 @@ def main():
             planned = next_start_override
             planned_is_override = True
         elif schedule is not None:
-            planned = schedule.next_on_or_after(now())
+            planned = schedule.next_on_or_after(tnow)
 
         if planned is not None:
             planned = planned.replace(second=0, microsecond=0)
-            if planned > now():
+            if planned > tnow:
                 # If this wait would cross a calendar-gap blocked period, default to stopping unless explicitly told to wait.
                 if (
                     args.enforce_calendar_gap
@@ -1507,18 +1783,12 @@ def main():
                     and state["day_done"] == 0
                     and state.get("measurement_days")
                 ):
-                    last = date.fromisoformat(state["measurement_days"][-1])
-                    allowed_day = last + timedelta(days=2)
+                    allowed_day = last_measured_day + timedelta(days=2)
                     if planned.date() < allowed_day:
                         planned = _first_start_for_day(allowed_day)
 
                 # Don't wait past the point where finishing today's remaining measurements becomes infeasible.
                 if planned.date() == today:
-                    latest_next_start = (latest_start_dt - timedelta(seconds=1)) - min_remaining_gap_total(
-                        next_completed_in_day=state["day_done"] + 1,
-                        day_goal=state["day_goal"],
-                        min_gap_buffer_seconds=args.min_gap_buffer_seconds,
-                    )
                     if planned > latest_next_start:
                         msg = (
                             f"WARNING: Planned next start {planned} is too late to finish today "
@@ -1543,15 +1813,17 @@ def main():
                         _log(f"SCHED calendar_gap_stop next={iso_dt(planned)}")
                         return
 
-                    print(f"Next measurement scheduled at {planned} ...")
-                    _log(f"SCHED next_override sleep_until={iso_dt(planned)}")
-                    sleep_until(planned)
+                    announce_wait(
+                        planned,
+                        f"Next measurement scheduled at {planned} ...",
+                        f"SCHED next_override sleep_until={iso_dt(planned)}",
+                    )
                     next_start_override = None
                     continue
             next_start_override = None
 
         # If it's too late to start/continue today, warn and roll to the next day.
-        if now() >= latest_start_dt:
+        if tnow >= latest_start_dt:
             if state["day_done"] == 0:
                 print(
                     f"WARNING: It's past today's start cutoff ({latest_start_dt}) "
@@ -1571,25 +1843,19 @@ def main():
             if state["day_done"] == 0:
                 next_day = today + timedelta(days=1)
             else:
-                last_measured = (
-                    date.fromisoformat(state["measurement_days"][-1]) if state.get("measurement_days") else today
-                )
-                next_day = _next_allowed_measurement_day(last_measured)
+                next_day = _next_allowed_measurement_day(last_measured_day or today)
             target = _first_start_for_day(next_day)
-            print(f"Waiting until next measurement day: {target} ...")
-            _log(f"SCHED day_end sleep_until={iso_dt(target)} day_done={state.get('day_done')}")
-            sleep_until(target)
+            announce_wait(
+                target,
+                f"Waiting until next measurement day: {target} ...",
+                f"SCHED day_end sleep_until={iso_dt(target)} day_done={state.get('day_done')}",
+            )
             continue
 
         # Feasibility check: can we still finish today's remaining measurements within the window?
-        latest_next_start = (latest_start_dt - timedelta(seconds=1)) - min_remaining_gap_total(
-            next_completed_in_day=state["day_done"] + 1,
-            day_goal=state["day_goal"],
-            min_gap_buffer_seconds=args.min_gap_buffer_seconds,
-        )
-        if now() > latest_next_start:
+        if tnow > latest_next_start:
             msg = (
-                f"WARNING: Starting the next measurement now ({now()}) is too late to finish "
+                f"WARNING: Starting the next measurement now ({tnow}) is too late to finish "
                 f"today within the window ending at {day_end_dt} "
                 f"(done {state['day_done']}/{state['day_goal']})."
             )
@@ -1598,14 +1864,16 @@ def main():
             if state["day_done"] == 0 and run_until_campaign:
                 next_day = today + timedelta(days=1)
                 target = _first_start_for_day(next_day)
-                print(f"Waiting until next measurement day: {target} ...")
-                _log(f"SCHED infeasible_start sleep_until={iso_dt(target)}")
-                sleep_until(target)
+                announce_wait(
+                    target,
+                    f"Waiting until next measurement day: {target} ...",
+                    f"SCHED infeasible_start sleep_until={iso_dt(target)}",
+                )
                 continue
 
-        # Refresh the window (script may sleep for hours/days)
+        # Refresh the window (script may sleep for hours/days); reconnect from scratch after UI failures.
         try:
-            win = connect_main_window()
+            win = reconnect_main_window(win if ui_failures == 0 else None)
             st, et = run_single_measurement(win, allow_start_new_campaign=args.run_forever)
             ui_failures = 0
         except CampaignCompleteInUI as e:
@@ -1649,11 +1917,11 @@ def main():
         except (PywinautoTimeoutError, RuntimeError) as e:
             ui_failures += 1
             dump_path = dump_ui(win, "ui_failure") if "win" in locals() else None
-            delay = min(600, 30 * ui_failures)
-            msg = f"WARNING: UI not ready ({e}). Retrying in {delay}s..."
+            retry_delay = ui_retry_delay(retry_delay if ui_failures > 1 else None, retry_rng)
+            msg = f"WARNING: UI not ready ({e}). Retrying in {retry_delay:.0f}s..."
             print(msg, flush=True)
             _log("UI_RETRY " + msg + (f" dump={dump_path}" if dump_path else ""))
-            sleep_until(now() + timedelta(seconds=delay))
+            sleep_until(now() + timedelta(seconds=retry_delay))
             continue
         state["last_start"] = iso_dt(st)
         state["last_end"] = iso_dt(et)
@@ -1713,22 +1981,22 @@ def main():
             if not run_until_campaign:
                 return
 
-            last_measured = date.fromisoformat(state["measurement_days"][-1]) if state.get("measurement_days") else today
-            next_day = _next_allowed_measurement_day(last_measured)
+            # record_measurement_day() above may have just added today, so don't reuse the value
+            # read at the top of this pass.
+            next_day = _next_allowed_measurement_day(last_measurement_day(state) or today)
             target = _first_start_for_day(next_day)
-            print(f"Waiting until next measurement day: {target} ...")
-            _log(f"SCHED cannot_fit_today sleep_until={iso_dt(target)}")
-            sleep_until(target)
+            announce_wait(
+                target,
+                f"Waiting until next measurement day: {target} ...",
+                f"SCHED cannot_fit_today sleep_until={iso_dt(target)}",
+            )
             continue
 
-        print(
-            f"Next measurement scheduled at {next_start} "
-            f"(start cutoff {latest_start_dt}, window end {day_end_dt})"
-        )
-        _log(
-            f"SCHED next_start={iso_dt(next_start)} start_cutoff={iso_dt(latest_start_dt)} window_end={iso_dt(day_end_dt)}"
+        announce_wait(
+            next_start,
+            f"Next measurement scheduled at {next_start} (start cutoff {latest_start_dt}, window end {day_end_dt})",
+            f"SCHED next_start={iso_dt(next_start)} start_cutoff={iso_dt(latest_start_dt)} window_end={iso_dt(day_end_dt)}",
         )
-        sleep_until(next_start)
 
 
 if __name__ == "__main__":
@@ -36,3 +36,44 @@ def test_choose_next_start_time_uses_cron_schedule():
     assert next_start is not None
     assert next_start.minute == 0
     assert next_start >= last_start + bbm.min_gap_after_completed(1, min_gap_buffer_seconds=120)
+
+
+def test_cron_next_on_or_after_same_hour_later_minute():
+    sch = bbm.parse_cron_schedule("15,45 10 * * *")
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 10, 20, 0)) == datetime(2026, 1, 7, 10, 45, 0)
+
+
+def test_cron_next_on_or_after_exact_match_is_returned():
+    sch = bbm.parse_cron_schedule("15,45 10 * * *")
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 10, 45, 0)) == datetime(2026, 1, 7, 10, 45, 0)
+
+
+def test_cron_next_on_or_after_rolls_to_next_hour_and_next_day():
+    sch = bbm.parse_cron_schedule("15,45 7,10 * * *")
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 7, 50, 0)) == datetime(2026, 1, 7, 10, 15, 0)
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 10, 46, 0)) == datetime(2026, 1, 8, 7, 15, 0)
+    # Month/year boundaries are handled by plain date arithmetic.
+    assert sch.next_on_or_after(datetime(2026, 12, 31, 23, 0, 0)) == datetime(2027, 1, 1, 7, 15, 0)
+
+
+def test_cron_next_on_or_after_past_last_hour_is_tomorrow_not_overmorrow():
+    # Regression: the old day-by-day scan skipped a whole day once it passed the last hour.
+    sch = bbm.parse_cron_schedule("0 7,10,20 * * *")
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 20, 1, 0)) == datetime(2026, 1, 8, 7, 0, 0)
+    assert sch.next_on_or_after(datetime(2026, 1, 7, 23, 59, 30)) == datetime(2026, 1, 8, 7, 0, 0)
+
+
+def test_parse_cron_schedule_step_fields():
+    sch = bbm.parse_cron_schedule("*/15 */6 * * *")
+    assert sch.minutes == (0, 15, 30, 45)
+    assert sch.hours == (0, 6, 12, 18)
+    mixed = bbm.parse_cron_schedule("*/30,5 8 * * *")
+    assert mixed.minutes == (0, 5, 30)
+
+
+def test_schedule_has_time_in_window():
+    sch = bbm.parse_cron_schedule("30 7,20 * * *")
+    d = datetime(2000, 1, 1)
+    assert bbm.schedule_has_time_in_window(sch, d.replace(hour=7), d.replace(hour=8)) is True
+    assert bbm.schedule_has_time_in_window(sch, d.replace(hour=8), d.replace(hour=20, minute=30)) is False
+    assert bbm.schedule_has_time_in_window(sch, d.replace(hour=8), d.replace(hour=20, minute=31)) is True
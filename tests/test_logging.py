@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import breitbandmessung_automate_stateful as bbm
+
+
+def test_log_appends_lines(monkeypatch, tmp_path):
+    logfile = tmp_path / "bbm.log"
+    monkeypatch.setattr(bbm, "LOGFILE", logfile)
+    bbm._log("first")
+    bbm._log("second")
+    assert logfile.read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+def test_log_keeps_existing_content(monkeypatch, tmp_path):
+    logfile = tmp_path / "bbm.log"
+    logfile.write_text("old\n", encoding="utf-8")
+    monkeypatch.setattr(bbm, "LOGFILE", logfile)
+    bbm._log("new")
+    assert logfile.read_text(encoding="utf-8") == "old\nnew\n"
+
+
+def test_announce_wait_prints_logs_and_sleeps(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
+    slept = []
+    monkeypatch.setattr(bbm, "sleep_until", lambda t: slept.append(t))
+    target = datetime(2026, 1, 7, 12, 0, 0)
+    bbm.announce_wait(target, "Waiting ...", "SCHED test sleep_until=x")
+    assert capsys.readouterr().out == "Waiting ...\n"
+    assert "SCHED test sleep_until=x" in (tmp_path / "bbm.log").read_text(encoding="utf-8")
+    assert slept == [target]
@@ -46,3 +46,43 @@ def test_detect_progress_from_ui_prefers_maximum_when_multiple_candidates_exist(
         ]
     )
     assert bbm.detect_progress_from_ui(win, day_goal=10, campaign_goal=30) == (9, 30)
+
+
+def test_detect_progress_from_ui_does_not_join_numbers_across_elements():
+    win = Dialog(
+        [
+            Control(text="Messung 3", control_type="Text"),
+            Control(text="/10", control_type="Text"),
+            Control(text="Heute 2/10", control_type="Text"),
+            Control(text="Gesamt 12/30", control_type="Text"),
+        ]
+    )
+    assert bbm.detect_progress_from_ui(win, day_goal=10, campaign_goal=30) == (2, 12)
+
+
+def test_detect_progress_from_ui_counts_first_pair_per_element():
+    win = Dialog(
+        [
+            Control(text="Heute: 4/10 (Ziel 10/10)", control_type="Text"),
+            Control(text="Gesamt: 14/30", control_type="Text"),
+        ]
+    )
+    assert bbm.detect_progress_from_ui(win, day_goal=10, campaign_goal=30) == (4, 14)
+
+
+def test_detect_progress_from_ui_skips_full_walk_when_text_nodes_suffice():
+    walks = []
+
+    class CountingDialog(Dialog):
+        def descendants(self, control_type=None):
+            walks.append(control_type)
+            return super().descendants(control_type=control_type)
+
+    win = CountingDialog(
+        [
+            Control(text="4/10", control_type="Text"),
+            Control(text="14/30", control_type="Text"),
+        ]
+    )
+    assert bbm.detect_progress_from_ui(win, day_goal=10, campaign_goal=30) == (4, 14)
+    assert walks == ["Text"]
@@ -37,6 +37,17 @@ def test_min_remaining_gap_total_sums_all_future_gaps():
     assert total == expected
 
 
+def test_min_remaining_gap_total_matches_per_gap_sum():
+    for day_goal in (1, 5, 6, 10, 12):
+        for nxt in range(0, day_goal + 2):
+            expected = sum(
+                (bbm.min_gap_after_completed(c, min_gap_buffer_seconds=90) for c in range(nxt, day_goal)),
+                timedelta(0),
+            )
+            got = bbm.min_remaining_gap_total(next_completed_in_day=nxt, day_goal=day_goal, min_gap_buffer_seconds=90)
+            assert got == expected, (nxt, day_goal)
+
+
 def test_choose_next_start_time_none_when_infeasible():
     last_start = datetime(2026, 1, 7, 10, 0, 0)
     last_end = datetime(2026, 1, 7, 10, 5, 0)
@@ -146,3 +157,47 @@ def test_sleep_until_sleeps_in_chunks(monkeypatch):
     monkeypatch.setattr(bbm.time, "sleep", lambda s: calls.append(s))
     bbm.sleep_until(datetime(2026, 1, 7, 12, 2, 0))
     assert calls == [60.0, 60.0]
+
+
+def test_sleep_until_logs_heartbeat_during_long_waits(monkeypatch, tmp_path):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
+    clock = {"t": datetime(2026, 1, 7, 12, 0, 0)}
+    monkeypatch.setattr(bbm, "now", lambda: clock["t"])
+    monkeypatch.setattr(bbm.time, "sleep", lambda s: clock.update(t=clock["t"] + timedelta(seconds=s)))
+    bbm.sleep_until(datetime(2026, 1, 7, 13, 30, 0))
+    lines = (tmp_path / "bbm.log").read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "SLEEP heartbeat until=2026-01-07T13:30:00 remaining=3600s",
+        "SLEEP heartbeat until=2026-01-07T13:30:00 remaining=1800s",
+    ]
+
+
+def test_min_remaining_gap_total_is_memoized():
+    bbm.min_remaining_gap_total.cache_clear()
+    a = bbm.min_remaining_gap_total(next_completed_in_day=1, day_goal=10, min_gap_buffer_seconds=120)
+    b = bbm.min_remaining_gap_total(next_completed_in_day=1, day_goal=10, min_gap_buffer_seconds=120)
+    assert a == b
+    assert bbm.min_remaining_gap_total.cache_info().hits == 1
+    assert bbm.min_remaining_gap_total(next_completed_in_day=10, day_goal=10, min_gap_buffer_seconds=120) == timedelta(0)
+
+
+def test_ui_retry_delay_grows_with_jitter_and_caps():
+    rng = random.Random(1)
+    assert bbm.ui_retry_delay(None, rng) == 30.0
+    delay = None
+    delays = []
+    for _ in range(12):
+        delay = bbm.ui_retry_delay(delay, rng)
+        delays.append(delay)
+    assert all(30.0 <= d <= 600.0 for d in delays)
+    assert max(delays) > 90.0
+    assert bbm.ui_retry_delay(600.0, random.Random(2)) <= 600.0
+
+
+def test_parse_next_start_accepts_hhmm(monkeypatch):
+    today = real_date.today()
+    monkeypatch.setattr(bbm, "now", lambda: datetime.combine(today, dtime(12, 0)))
+    assert bbm.parse_next_start("13:05") == datetime.combine(today, dtime(13, 5))
+    # Times already passed today roll over to tomorrow.
+    assert bbm.parse_next_start("7:30") == datetime.combine(today + timedelta(days=1), dtime(7, 30))
+    assert bbm.parse_next_start("2026-01-07 08:15") == datetime(2026, 1, 7, 8, 15)
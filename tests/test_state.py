@@ -35,6 +35,31 @@ def test_save_state_writes_json(monkeypatch, tmp_path):
     assert not (tmp_path / "state.json.tmp").exists()
 
 
+def test_save_state_skips_unchanged_writes(monkeypatch, tmp_path):
+    path = tmp_path / "state.json"
+    replaced = []
+    real_replace = bbm.os.replace
+    monkeypatch.setattr(bbm.os, "replace", lambda a, b: replaced.append(b) or real_replace(a, b))
+    st = {"day_done": 1}
+    bbm.save_state(str(path), st)
+    bbm.save_state(str(path), st)
+    assert len(replaced) == 1
+    st["day_done"] = 2
+    bbm.save_state(str(path), st)
+    assert len(replaced) == 2
+    # A file removed behind our back is written again.
+    path.unlink()
+    bbm.save_state(str(path), st)
+    assert json.loads(path.read_text(encoding="utf-8")) == st
+
+
+def test_load_state_reads_saved_state(tmp_path):
+    path = tmp_path / "state.json"
+    st = {"day_goal": 10, "current_day": "2026-01-07", "measurement_days": ["2026-01-05"], "note": "geprüft"}
+    bbm.save_state(str(path), st)
+    assert bbm.load_state(str(path)) == st
+
+
 def test_ensure_day_rollover_resets_fields(monkeypatch):
     monkeypatch.setattr(bbm, "date", FakeDate)
     state = {
@@ -106,3 +131,26 @@ def test_calendar_gap_ok(monkeypatch):
     FakeDate._today = real_date(2026, 1, 7)
     assert bbm.calendar_gap_ok({"measurement_days": ["2026-01-06"]}) is False
     assert bbm.calendar_gap_ok({"measurement_days": ["2026-01-05"]}) is True
+
+
+def test_last_measurement_day():
+    assert bbm.last_measurement_day({}) is None
+    assert bbm.last_measurement_day({"measurement_days": []}) is None
+    assert bbm.last_measurement_day({"measurement_days": ["2026-01-05", "2026-01-07"]}) == real_date(2026, 1, 7)
+
+
+def test_sync_progress_from_ui_retries_after_failed_read(monkeypatch):
+    state = {"day_goal": 10, "campaign_goal": 30, "day_done": 0, "campaign_done": 0}
+    calls = []
+
+    def _ensure(_win):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("UI not ready")
+
+    monkeypatch.setattr(bbm, "ensure_on_campaign_page", _ensure)
+    monkeypatch.setattr(bbm, "detect_progress_from_ui", lambda _win, _d, _c: (3, 13))
+    assert bbm.sync_progress_from_ui(object(), state) is False
+    # An immediate re-check must read the UI again rather than being skipped.
+    assert bbm.sync_progress_from_ui(object(), state) is True
+    assert (state["day_done"], state["campaign_done"]) == (3, 13)
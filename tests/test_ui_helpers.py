@@ -73,6 +73,10 @@ def test_norm_text_and_token_set():
     assert bbm._token_set(s) == {"direkte", "lan", "verbindung", "geprueft"}
 
 
+def test_norm_text_transliterates_umlauts_and_collapses_separators():
+    assert bbm._norm_text("ÄRGER\tüber  Straße --\nÖl") == "aerger ueber strasse oel"
+
+
 def test_try_get_checked_state():
     c = Control(name="x", control_type="CheckBox", toggle_state=1)
     assert bbm._try_get_checked_state(c) is True
@@ -91,6 +95,18 @@ def test_try_click_named_toggle_clicks_best_match(monkeypatch):
     assert bad.clicks == 0
 
 
+def test_try_click_named_toggle_stops_at_exact_match(monkeypatch):
+    monkeypatch.setattr(bbm.time, "sleep", lambda *_args, **_kwargs: None)
+    scored = []
+    token_set = bbm._token_set
+    monkeypatch.setattr(bbm, "_token_set", lambda s: scored.append(s) or token_set(s))
+    exact = Control(name="VPN-Verbindungen ausgeschaltet?", control_type="Button", toggle_state=0)
+    later = Control(name="VPN-Verbindungen", control_type="Button", toggle_state=0)
+    assert bbm._try_click_named_toggle(Dialog([exact, later]), "VPN-Verbindungen ausgeschaltet?") is True
+    assert exact.clicks == 1
+    assert "VPN-Verbindungen" not in scored
+
+
 def test_try_click_named_toggle_does_not_click_if_already_checked(monkeypatch):
     monkeypatch.setattr(bbm.time, "sleep", lambda *_args, **_kwargs: None)
     c = Control(name="VPN-Verbindungen ausgeschaltet", control_type="Button", toggle_state=1)
@@ -150,6 +166,22 @@ def test_detect_calendar_gap_wait_parses_german_message():
     assert bbm.detect_calendar_gap_wait(win) == timedelta(hours=27, minutes=36)
 
 
+def test_detect_calendar_gap_wait_message_split_across_text_nodes():
+    win = Dialog(
+        [
+            Control(name="Sie können die Messung in", control_type="Text"),
+            Control(name="04:05 Stunden durchführen,", control_type="Text"),
+            Control(name="da zwischen den Messtagen ein Kalendertag liegen muss.", control_type="Text"),
+        ]
+    )
+    assert bbm.detect_calendar_gap_wait(win) == timedelta(hours=4, minutes=5)
+
+
+def test_detect_calendar_gap_wait_ignores_unrelated_times():
+    win = Dialog([Control(name="Nächste Messung in 00:05 Stunden", control_type="Text")])
+    assert bbm.detect_calendar_gap_wait(win) is None
+
+
 def test_detect_campaign_complete_screen_from_text():
     win = Dialog([Control(name="Messkampagne abgeschlossen!", control_type="Text")])
     assert bbm.detect_campaign_complete_screen(win) is True
@@ -185,6 +217,31 @@ def test_click_by_text_clicks(monkeypatch):
     assert btn.clicks == 1
 
 
+def test_click_by_text_probes_once_per_criterion_when_missing(monkeypatch):
+    monkeypatch.setattr(bbm, "wait_until_passes", lambda _t, _i, fn: fn())
+    probes = []
+
+    class Missing:
+        def __init__(self, kwargs):
+            self.kwargs = kwargs
+
+        def exists(self, timeout=None):
+            probes.append((tuple(sorted(self.kwargs)), timeout))
+            return False
+
+    class Win:
+        def child_window(self, **kwargs):
+            return Missing(kwargs)
+
+    try:
+        bbm.click_by_text(Win(), text="Messung", title_re=bbm.TAB_MEASUREMENT_RE, control_type="TabItem", timeout=1)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected RuntimeError")
+    assert probes == [(("title",), 0.5), (("title_re",), 0.5)]
+
+
 def test_ensure_on_measurement_tab_clicks_messung(monkeypatch):
     calls = []
     monkeypatch.setattr(bbm.time, "sleep", lambda *_args, **_kwargs: None)
@@ -199,25 +256,62 @@ def test_ensure_on_measurement_tab_clicks_messung(monkeypatch):
     assert calls[0][0] == bbm.TAB_MEASUREMENT
 
 
+def test_ensure_on_measurement_tab_tries_last_good_control_type_first(monkeypatch):
+    monkeypatch.setattr(bbm, "_LAST_GOOD_CONTROL_TYPE", {})
+    monkeypatch.setattr(bbm.time, "sleep", lambda *_args, **_kwargs: None)
+    attempts = []
+
+    def _fake_click_by_text(_win, text=None, *, title_re=None, control_type=None, timeout=10):
+        attempts.append(control_type)
+        if control_type != "Text":
+            raise RuntimeError("not found")
+        return True
+
+    monkeypatch.setattr(bbm, "click_by_text", _fake_click_by_text)
+    assert bbm.ensure_on_measurement_tab(object()) is True
+    assert attempts == ["TabItem", "Button", "Text"]
+    attempts.clear()
+    assert bbm.ensure_on_measurement_tab(object()) is True
+    assert attempts == ["Text"]
+
+
 def test_ensure_on_campaign_page_calls_ensure_on_measurement_tab(monkeypatch):
     calls = []
     monkeypatch.setattr(bbm, "ensure_on_measurement_tab", lambda _w: calls.append("tab") or True)
+    monkeypatch.setattr(bbm, "click_by_text", lambda *_a, **_kw: True)
+    monkeypatch.setattr(bbm.time, "sleep", lambda *_args, **_kwargs: None)
 
     class Btn:
+        visible = False
+
         def exists(self, *_args, **_kwargs):
-            return True
+            return Btn.visible
 
         def wait(self, *_args, **_kwargs):
             return True
 
     class Win:
         def child_window(self, **_kwargs):
+            Btn.visible = bool(calls)  # the button shows up once the "Messung" tab was selected
             return Btn()
 
     bbm.ensure_on_campaign_page(Win())
     assert calls == ["tab"]
 
 
+def test_ensure_on_campaign_page_returns_early_when_button_visible(monkeypatch):
+    calls = []
+    monkeypatch.setattr(bbm, "ensure_on_measurement_tab", lambda _w: calls.append("tab") or True)
+    monkeypatch.setattr(bbm, "detect_campaign_complete_screen", lambda _w: calls.append("complete") or False)
+
+    class Win:
+        def child_window(self, **_kwargs):
+            return Control(name="Messung durchführen", control_type="Button")
+
+    bbm.ensure_on_campaign_page(Win(), allow_start_new_campaign=True)
+    assert calls == []
+
+
 def test_click_start_measurement_waits_until_enabled(monkeypatch):
     class Btn:
         def __init__(self):
@@ -261,7 +355,8 @@ def test_click_start_measurement_waits_until_enabled(monkeypatch):
     assert btn.clicks == 1
 
 
-def test_run_single_measurement_smoke(monkeypatch):
+def test_run_single_measurement_smoke(monkeypatch, tmp_path):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
     calls = []
     monkeypatch.setattr(bbm, "ensure_on_campaign_page", lambda _w, **_kw: calls.append("ensure_on_campaign_page"))
     monkeypatch.setattr(bbm, "wait_for_campaign_ready", lambda _w, timeout=0: calls.append(f"ready:{timeout}"))
@@ -282,3 +377,288 @@ def test_run_single_measurement_smoke(monkeypatch):
     assert st == datetime(2026, 1, 7, 12, 0, 0)
     assert et == datetime(2026, 1, 7, 12, 5, 0)
     assert "ensure_on_campaign_page" in calls
+
+
+def test_wait_for_campaign_ready_backs_off_between_polls(monkeypatch):
+    sleeps = []
+
+    class Btn:
+        def exists(self, *_args, **_kwargs):
+            return False
+
+        def wait(self, *_args, **_kwargs):
+            raise RuntimeError("not visible")
+
+    class Win:
+        def child_window(self, **_kwargs):
+            return Btn()
+
+    def _sleep(s):
+        sleeps.append(s)
+        if len(sleeps) >= 12:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(bbm, "detect_campaign_complete_screen", lambda _w: False)
+    monkeypatch.setattr(bbm, "detect_calendar_gap_wait", lambda _w: None)
+    monkeypatch.setattr(bbm.time, "sleep", _sleep)
+    try:
+        bbm.wait_for_campaign_ready(Win(), timeout=3600)
+    except KeyboardInterrupt:
+        pass
+    assert sleeps[0] == 0.5
+    assert all(b >= a for a, b in zip(sleeps, sleeps[1:]))
+    assert max(sleeps) == 15.0
+
+
+def test_wait_for_campaign_ready_resets_backoff_when_screen_changes(monkeypatch):
+    sleeps = []
+    texts = [Control(name="Messung läuft", control_type="Text")]
+
+    class Missing:
+        def exists(self, *_args, **_kwargs):
+            return False
+
+    class Win:
+        def child_window(self, **_kwargs):
+            return Missing()
+
+        def descendants(self, control_type=None):
+            return list(texts)
+
+    def _sleep(s):
+        sleeps.append(s)
+        if len(sleeps) == 4:
+            texts.append(Control(name="Ergebnis", control_type="Text"))
+        if len(sleeps) >= 6:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(bbm.time, "sleep", _sleep)
+    try:
+        bbm.wait_for_campaign_ready(Win(), timeout=3600)
+    except KeyboardInterrupt:
+        pass
+    assert sleeps[:4] == [0.5, 0.75, 1.125, 1.6875]
+    # The new element shows up on the next tick, so that tick polls at the base rate again.
+    assert sleeps[4:] == [0.5, 0.75]
+
+
+def test_find_by_title_re_skips_visibility_wait_when_absent(monkeypatch):
+    monkeypatch.setattr(bbm, "_LAST_GOOD_TITLE_RE_LOOKUP", {})
+    probes = []
+
+    class Spec:
+        def __init__(self, kwargs):
+            self.kwargs = kwargs
+
+        def exists(self, timeout=None):
+            probes.append((self.kwargs.get("control_type"), timeout))
+            return False
+
+        def wait(self, *_args, **_kwargs):
+            raise AssertionError("must not wait on a missing control")
+
+    class Win:
+        def child_window(self, **kwargs):
+            return Spec(kwargs)
+
+    assert bbm._find_by_title_re(Win(), bbm.BTN_DO_MEASUREMENT_RE) is None
+    # One timed typed lookup, then a single non-waiting untyped probe.
+    assert probes == [("Button", 0.5), (None, 0)]
+
+
+def test_find_by_title_re_tries_last_good_variant_first(monkeypatch):
+    monkeypatch.setattr(bbm, "_LAST_GOOD_TITLE_RE_LOOKUP", {})
+    probes = []
+
+    class Spec:
+        def __init__(self, kwargs):
+            self.kwargs = kwargs
+
+        def exists(self, timeout=None):
+            probes.append((self.kwargs.get("control_type"), timeout))
+            # The app exposes this control without the Button type.
+            return "control_type" not in self.kwargs
+
+    class Win:
+        def child_window(self, **kwargs):
+            return Spec(kwargs)
+
+    assert bbm._find_by_title_re(Win(), bbm.BTN_DO_MEASUREMENT_RE) is not None
+    assert probes == [("Button", 0.5), (None, 0)]
+
+    probes.clear()
+    assert bbm._find_by_title_re(Win(), bbm.BTN_DO_MEASUREMENT_RE) is not None
+    assert probes == [(None, 0.5)]
+
+
+def test_find_by_title_re_falls_back_to_typed_when_untyped_is_ambiguous(monkeypatch):
+    key = (bbm.BTN_DO_MEASUREMENT_RE.pattern, "Button")
+    monkeypatch.setattr(bbm, "_LAST_GOOD_TITLE_RE_LOOKUP", {key: False})
+    probes = []
+
+    class Spec:
+        def __init__(self, kwargs):
+            self.kwargs = kwargs
+
+        def exists(self, timeout=None):
+            probes.append((self.kwargs.get("control_type"), timeout))
+            if "control_type" not in self.kwargs:
+                # Button plus its same-named Text child.
+                raise bbm.ElementAmbiguousError("2 elements match")
+            return True
+
+    class Win:
+        def child_window(self, **kwargs):
+            return Spec(kwargs)
+
+    spec = bbm._find_by_title_re(Win(), bbm.BTN_DO_MEASUREMENT_RE)
+    assert spec is not None and spec.kwargs.get("control_type") == "Button"
+    # The ambiguous probe returned at once, so the typed lookup still gets the wait.
+    assert probes == [(None, 0.5), ("Button", 0.5)]
+    assert bbm._LAST_GOOD_TITLE_RE_LOOKUP[key] is True
+
+
+def test_wait_for_campaign_ready_walks_text_nodes_once_per_tick(monkeypatch):
+    walks = []
+    msg = (
+        "Sie können die Messung in 01:30 Stunden durchführen, da zwischen den Messtagen "
+        "ein zeitlicher Mindestabstand von einem Kalendertag eingehalten werden muss."
+    )
+
+    class Missing:
+        def exists(self, *_args, **_kwargs):
+            return False
+
+    class Win(Dialog):
+        def child_window(self, **_kwargs):
+            return Missing()
+
+        def descendants(self, control_type=None):
+            walks.append(control_type)
+            return super().descendants(control_type=control_type)
+
+    monkeypatch.setattr(bbm, "_find_by_title_re", lambda *_a, **_k: None)
+    win = Win([Control(name=msg, control_type="Text")])
+    try:
+        bbm.wait_for_campaign_ready(win, timeout=60)
+    except bbm.CalendarGapBlocked as e:
+        assert e.wait == timedelta(hours=1, minutes=30)
+    else:
+        raise AssertionError("expected CalendarGapBlocked")
+    assert walks.count("Text") == 1
+
+
+class _FakeTopWindow:
+    def __init__(self, handle, title, class_name="Chrome_WidgetWin_1"):
+        self.handle = handle
+        self._title = title
+        self.element_info = type("EI", (), {"class_name": class_name})()
+        self.focused = False
+
+    def window_text(self):
+        return self._title
+
+    def is_visible(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def set_focus(self):
+        self.focused = True
+
+
+def _fake_desktop(top_windows, probes):
+    class Spec:
+        def __init__(self, handle):
+            self.handle = handle
+
+        def child_window(self, **_kwargs):
+            probes.append(self.handle)
+            return Control(name="", control_type="Button")
+
+    class FakeDesktop:
+        def __init__(self, backend=None):
+            pass
+
+        def windows(self, **_kwargs):
+            return list(top_windows)
+
+        def window(self, handle=None):
+            return Spec(handle)
+
+    return FakeDesktop
+
+
+def test_connect_main_window_single_candidate_skips_content_probes(monkeypatch):
+    probes = []
+    w = _FakeTopWindow(1, "Breitbandmessung")
+    monkeypatch.setattr(bbm, "Desktop", _fake_desktop([w], probes))
+    monkeypatch.setattr(bbm, "_find_chrome_content_handle", lambda hwnd: 100 + hwnd)
+    root = bbm.connect_main_window()
+    assert root.handle == 101
+    assert w.focused is True
+    assert probes == []
+
+
+def test_connect_main_window_prefers_app_window_over_browser(monkeypatch, tmp_path):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
+    probes = []
+    browser = _FakeTopWindow(1, "Breitbandmessung - Mozilla Firefox", class_name="MozillaWindowClass")
+    app = _FakeTopWindow(2, "Breitbandmessung")
+    monkeypatch.setattr(bbm, "Desktop", _fake_desktop([browser, app], probes))
+    monkeypatch.setattr(bbm, "_find_chrome_content_handle", lambda hwnd: 100 + hwnd if hwnd == 2 else None)
+    root = bbm.connect_main_window()
+    assert root.handle == 102
+    assert app.focused is True
+    assert probes == []  # the title/class score alone is decisive
+
+
+def test_reconnect_main_window_reuses_live_window(monkeypatch, tmp_path):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
+    connects = []
+    monkeypatch.setattr(bbm, "connect_main_window", lambda: connects.append(1) or "fresh")
+    clock = {"t": 1000.0}
+    monkeypatch.setattr(bbm.time, "monotonic", lambda: clock["t"])
+
+    class Wnd:
+        def __init__(self, alive=True):
+            self.alive = alive
+            self.focused = False
+
+        def exists(self, timeout=None):
+            return self.alive
+
+        def set_focus(self):
+            self.focused = True
+
+    live, top = Wnd(), Wnd()
+    monkeypatch.setattr(bbm, "_connected", {"root": live, "top": top, "last_used": 1000.0})
+    clock["t"] = 1060.0
+    assert bbm.reconnect_main_window(live) is live
+    # The top-level window gets the focus, not the content root.
+    assert top.focused is True and live.focused is False
+    assert connects == []
+
+    # Idle longer than the limit (e.g. after a long sleep): don't trust the cached root.
+    clock["t"] = 1060.0 + bbm.MAIN_WINDOW_MAX_IDLE_SECONDS + 1
+    assert bbm.reconnect_main_window(live) == "fresh"
+
+    dead = Wnd(alive=False)
+    monkeypatch.setattr(bbm, "_connected", {"root": dead, "top": top, "last_used": clock["t"]})
+    assert bbm.reconnect_main_window(dead) == "fresh"
+    assert bbm.reconnect_main_window(None) == "fresh"
+    assert len(connects) == 3
+
+
+def test_connect_main_window_takes_unique_perfect_match_without_probes(monkeypatch, tmp_path):
+    monkeypatch.setattr(bbm, "LOGFILE", tmp_path / "bbm.log")
+    probes = []
+    # Same title and class but no content hwnd: still within 20 points (70 vs. 90).
+    other = _FakeTopWindow(1, "Breitbandmessung")
+    app = _FakeTopWindow(2, "Breitbandmessung")
+    monkeypatch.setattr(bbm, "Desktop", _fake_desktop([other, app], probes))
+    monkeypatch.setattr(bbm, "_find_chrome_content_handle", lambda hwnd: 100 + hwnd if hwnd == 2 else None)
+    root = bbm.connect_main_window()
+    assert root.handle == 102
+    assert probes == []